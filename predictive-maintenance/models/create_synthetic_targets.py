@@ -5,12 +5,30 @@ print("="*80)
 print("CREATING REALISTIC SYNTHETIC TARGETS")
 print("="*80)
 
-# Load your original data
-df = pd.read_csv('../data/merged_one.csv')
+# Columns the script actually uses (after name cleaning)
+INPUT_COLS = ['type', 'rotational_speed_rpm', 'torque_nm', 'tool_wear_min',
+              'process_temperature_k', 'air_temperature_k', 'temperature',
+              'humidity', 'rainfall']
+NUMERIC_COLS = [c for c in INPUT_COLS if c != 'type']
+
+
+def clean_columns(columns):
+    return columns.str.strip().str.lower().str.replace(' ', '_').str.replace('[^a-z0-9_]', '', regex=True)
+
+
+# Load your original data — read the header first, then only parse the
+# columns we need as float32 (the merged file carries 70+ columns)
+data_path = '../data/merged_one.csv'
+raw_columns = pd.read_csv(data_path, nrows=0).columns
+raw_to_clean = dict(zip(raw_columns, clean_columns(raw_columns)))
+usecols = [raw for raw, clean in raw_to_clean.items() if clean in INPUT_COLS]
+dtypes = {raw: np.float32 for raw in usecols if raw_to_clean[raw] in NUMERIC_COLS}
+
+df = pd.read_csv(data_path, usecols=usecols, dtype=dtypes)
 print(f"\n✅ Loaded data: {df.shape}")
 
 # Clean column names
-df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_').str.replace('[^a-z0-9_]', '', regex=True)
+df.columns = clean_columns(df.columns)
 
 # ==============================
 # CREATE REALISTIC TARGETS BASED ON PHYSICS
@@ -18,48 +36,78 @@ df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_').str.replac
 
 print("\n[1/3] Creating synthetic targets based on operational physics...")
 
+# Pull the feature columns out as raw ndarrays once and build each
+# target in place (precomputed reciprocals, clip/subtract with out=)
+# instead of materializing intermediate pandas Series
+rng = np.random.default_rng()
+n = len(df)
+# One float32 noise buffer refilled in place for all three noisy targets
+noise = np.empty(n, dtype=np.float32)
+rpm = df['rotational_speed_rpm'].to_numpy(copy=False)
+torque = df['torque_nm'].to_numpy(copy=False)
+wear = df['tool_wear_min'].to_numpy(copy=False)
+process_temp = df['process_temperature_k'].to_numpy(copy=False)
+air_temp = df['air_temperature_k'].to_numpy(copy=False)
+humidity = df['humidity'].to_numpy(copy=False)
+temp_difference = process_temp - air_temp
+
 # 1. VIBRATION HEALTH (0-100, higher = better)
 # Bad when: high speed + high torque + high tool wear
-df['vibration_stress'] = (
-    (df['rotational_speed_rpm'] / 6000) * 0.3 +  # Speed factor
-    (df['torque_nm'] / 100) * 0.3 +              # Torque factor
-    (df['tool_wear_min'] / 300) * 0.4            # Wear factor (most important)
+vibration_health = (
+    rpm * (0.3 / 6000) +     # Speed factor
+    torque * (0.3 / 100) +   # Torque factor
+    wear * (0.4 / 300)       # Wear factor (most important)
 )
-df['vibration_health'] = 100 - np.clip(df['vibration_stress'] * 100, 0, 100)
-df['vibration_health'] = df['vibration_health'] + np.random.normal(0, 3, len(df))  # Add realistic noise
-df['vibration_health'] = np.clip(df['vibration_health'], 0, 100)
+np.multiply(vibration_health, 100, out=vibration_health)
+np.clip(vibration_health, 0, 100, out=vibration_health)
+np.subtract(100, vibration_health, out=vibration_health)
+rng.standard_normal(out=noise, dtype=np.float32)
+noise *= 3
+vibration_health += noise  # Add realistic noise
+np.clip(vibration_health, 0, 100, out=vibration_health)
 
 # 2. THERMAL HEALTH (0-100, higher = better)
 # Bad when: high temperature difference + high process temp
-df['temp_difference'] = df['process_temperature_k'] - df['air_temperature_k']
-df['thermal_stress'] = (
-    (df['temp_difference'] / 30) * 0.6 +        # Temp delta (most important)
-    (df['process_temperature_k'] / 330) * 0.4   # Absolute temp
+thermal_health = (
+    temp_difference * (0.6 / 30) +   # Temp delta (most important)
+    process_temp * (0.4 / 330)       # Absolute temp
 )
-df['thermal_health'] = 100 - np.clip(df['thermal_stress'] * 100, 0, 100)
-df['thermal_health'] = df['thermal_health'] + np.random.normal(0, 3, len(df))
-df['thermal_health'] = np.clip(df['thermal_health'], 0, 100)
+np.multiply(thermal_health, 100, out=thermal_health)
+np.clip(thermal_health, 0, 100, out=thermal_health)
+np.subtract(100, thermal_health, out=thermal_health)
+rng.standard_normal(out=noise, dtype=np.float32)
+noise *= 3
+thermal_health += noise
+np.clip(thermal_health, 0, 100, out=thermal_health)
 
 # 3. EFFICIENCY INDEX (0-100, higher = better)
 # Bad when: high tool wear + high torque + temperature issues
-df['efficiency_degradation'] = (
-    (df['tool_wear_min'] / 300) * 0.5 +         # Wear (most important)
-    (df['torque_nm'] / 100) * 0.2 +             # Load
-    (df['temp_difference'] / 30) * 0.2 +        # Thermal inefficiency
-    (df['humidity'] / 100) * 0.1                # Environmental
+efficiency_index = (
+    wear * (0.5 / 300) +             # Wear (most important)
+    torque * (0.2 / 100) +           # Load
+    temp_difference * (0.2 / 30) +   # Thermal inefficiency
+    humidity * (0.1 / 100)           # Environmental
 )
-df['efficiency_index'] = 100 - np.clip(df['efficiency_degradation'] * 100, 0, 100)
-df['efficiency_index'] = df['efficiency_index'] + np.random.normal(0, 4, len(df))
-df['efficiency_index'] = np.clip(df['efficiency_index'], 0, 100)
+np.multiply(efficiency_index, 100, out=efficiency_index)
+np.clip(efficiency_index, 0, 100, out=efficiency_index)
+np.subtract(100, efficiency_index, out=efficiency_index)
+rng.standard_normal(out=noise, dtype=np.float32)
+noise *= 4
+efficiency_index += noise
+np.clip(efficiency_index, 0, 100, out=efficiency_index)
 
 # 4. FAILURE RISK (0-100, higher = worse)
 # Composite of all health indicators
-df['failure_risk'] = (
-    (100 - df['vibration_health']) * 0.35 +
-    (100 - df['thermal_health']) * 0.30 +
-    (100 - df['efficiency_index']) * 0.35
+failure_risk = (
+    (100 - vibration_health) * 0.35 +
+    (100 - thermal_health) * 0.30 +
+    (100 - efficiency_index) * 0.35
 )
-df['failure_risk'] = np.clip(df['failure_risk'], 0, 100)
+np.clip(failure_risk, 0, 100, out=failure_risk)
+
+# Single block-insert of all four targets instead of four column writes
+df[['vibration_health', 'thermal_health', 'efficiency_index', 'failure_risk']] = \
+    np.column_stack([vibration_health, thermal_health, efficiency_index, failure_risk])
 
 print("✅ Synthetic targets created")
 
@@ -95,10 +143,8 @@ keep_cols = key_features + ['air_temperature_k', 'temperature', 'humidity', 'rai
 if 'type' in df.columns:
     keep_cols.insert(0, 'type')
 
-df_clean = df[keep_cols].copy()
-
-# Remove outliers (optional)
-df_clean = df_clean.dropna()
+# Remove outliers (optional) — dropna already returns a fresh frame
+df_clean = df[keep_cols].dropna()
 
 output_file = '../data/merged_one_CORRECTED.csv'
 df_clean.to_csv(output_file, index=False)
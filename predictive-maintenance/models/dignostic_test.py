@@ -2,6 +2,8 @@ import joblib
 import pandas as pd
 import numpy as np
 
+from scorer import BatchScorer
+
 print("="*80)
 print("DIAGNOSTIC TEST - CHECKING MODEL OUTPUT RANGES")
 print("="*80)
@@ -49,27 +51,21 @@ print("\n" + "="*80)
 print("RAW MODEL OUTPUTS (BEFORE NORMALIZATION)")
 print("="*80)
 
-for scenario_name, data in [("PERFECT MACHINE", perfect), 
-                             ("TERRIBLE MACHINE", terrible),
-                             ("HEALTHY PUMP (PMP-001)", healthy_pump)]:
+scenario_names = ["PERFECT MACHINE", "TERRIBLE MACHINE", "HEALTHY PUMP (PMP-001)"]
+
+# Stack all scenarios into one (3, 8) matrix — the shared scorer calls
+# each model once per target instead of once per scenario per target
+X = pd.concat([perfect, terrible, healthy_pump], ignore_index=True)
+
+scorer = BatchScorer(model_package)
+raw_scores = scorer.predict(X.to_numpy(dtype=np.float32), clip=False)
+
+for i, scenario_name in enumerate(scenario_names):
     print(f"\n{scenario_name}:")
     print("-" * 60)
-    
-    for target in model_package['target_names']:
-        target_block = model_package['all_models'][target]
-        models = target_block['models']
-        weights = target_block['weights']
-        
-        preds = np.array([
-            models["xgboost"].predict(data)[0],
-            models["random_forest"].predict(data)[0],
-            models["gradient_boosting"].predict(data)[0],
-            models["ridge"].predict(data)[0]
-        ])
-        
-        ensemble_pred = np.dot(weights, preds)
-        
-        print(f"  {target:25s}: {ensemble_pred:10.4f}")
+
+    for ti, target in enumerate(scorer.targets):
+        print(f"  {target:25s}: {raw_scores[i, ti]:10.4f}")
 
 print("\n" + "="*80)
 print("INTERPRETATION GUIDE:")
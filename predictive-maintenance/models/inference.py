@@ -3,6 +3,11 @@ import pandas as pd
 import numpy as np
 import os
 
+try:
+    from models.scorer import BatchScorer
+except ImportError:
+    from scorer import BatchScorer
+
 # ==============================
 # Load Model Package and Scaler
 # ==============================
@@ -22,11 +27,42 @@ def load_model():
 def load_scaler():
     return joblib.load(SCALER_PATH)
 
-model_package = load_model()
-scaler = load_scaler()
-
-REQUIRED_FEATURES = model_package["feature_names"]
-TARGETS = model_package["target_names"]
+# ✅ Lazy singletons: importing this module no longer deserializes the
+# multi-MB model package — Streamlit reruns just reuse the cached objects
+_model_package = None
+_scaler = None
+_scaler_params = None
+_scorer = None
+
+def get_model_package():
+    global _model_package
+    if _model_package is None:
+        _model_package = load_model()
+    return _model_package
+
+def get_scaler():
+    global _scaler
+    if _scaler is None:
+        _scaler = load_scaler()
+    return _scaler
+
+def get_scaler_params():
+    """(center, 1/scale) from the fitted RobustScaler, cached as float32."""
+    global _scaler_params
+    if _scaler_params is None:
+        robust = get_scaler()
+        _scaler_params = (
+            robust.center_.astype(np.float32),
+            (1.0 / robust.scale_).astype(np.float32)
+        )
+    return _scaler_params
+
+def get_scorer():
+    """Shared BatchScorer built once over the loaded model package."""
+    global _scorer
+    if _scorer is None:
+        _scorer = BatchScorer(get_model_package())
+    return _scorer
 
 # ==============================
 # Main Prediction Function (FULLY FIXED)
@@ -42,48 +78,36 @@ def predict_from_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     - Proper column name mapping for Streamlit compatibility
     """
 
+    model_package = get_model_package()
+
+    required_features = model_package["feature_names"]
+    targets = model_package["target_names"]
+
     # Check for missing required features
-    missing_features = set(REQUIRED_FEATURES) - set(df.columns)
+    missing_features = set(required_features) - set(df.columns)
     if missing_features:
         raise ValueError(f"Missing required features: {missing_features}. "
-                        f"Required features are: {REQUIRED_FEATURES}")
+                        f"Required features are: {required_features}")
 
-    # Ensure correct feature order
-    df = df[REQUIRED_FEATURES].copy()
+    # Ensure correct feature order; float32 halves the memory traffic of
+    # the scale+predict hot path with no meaningful precision loss
+    df = df[required_features].astype(np.float32)
 
     # Handle NaN / infinite values safely
     df = df.replace([np.inf, -np.inf], np.nan)
     df = df.fillna(df.median()).fillna(0)
 
-    # ✅ CRITICAL FIX: Scale features using the saved scaler
-    df_scaled = scaler.transform(df)
-    df_scaled = pd.DataFrame(df_scaled, columns=REQUIRED_FEATURES)
-
-    results = {target: [] for target in TARGETS}
-
-    for _, row in df_scaled.iterrows():
-        row_df = pd.DataFrame([row])
-
-        for target in TARGETS:
-            target_block = model_package["all_models"][target]
-            models = target_block["models"]
-            weights = target_block["weights"]
-
-            preds = np.array([
-                models["xgboost"].predict(row_df)[0],
-                models["random_forest"].predict(row_df)[0],
-                models["gradient_boosting"].predict(row_df)[0],
-                models["ridge"].predict(row_df)[0]
-            ])
-
-            ensemble_pred = np.dot(weights, preds)
+    # ✅ CRITICAL FIX: Scale features using the saved scaler stats.
+    # RobustScaler is just (X - center) / scale, so apply it inline —
+    # one subtract + one multiply, none of sklearn's per-call validation
+    center, inv_scale = get_scaler_params()
+    X = (df.to_numpy(dtype=np.float32, copy=False) - center) * inv_scale
 
-            # ✅ Just clip to 0-100
-            score_0_100 = float(np.clip(ensemble_pred, 0, 100))
-            
-            results[target].append(score_0_100)
+    # ✅ VECTORIZED: the shared scorer runs each base model once on the
+    # whole batch and clips every target's ensemble to 0-100
+    ensemble = get_scorer().predict(X)
 
-    results_df = pd.DataFrame(results)
+    results_df = pd.DataFrame(ensemble, columns=targets)
     
     # ✅ Rename columns to match Streamlit expectations
     results_df = results_df.rename(columns={
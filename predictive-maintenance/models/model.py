@@ -16,10 +16,10 @@ print("="*80)
 # 1. LOAD DATA
 # =========================
 print("\n[1/6] Loading preprocessed data...")
-X_train_full = pd.read_csv("X_train.csv")
-X_test_full = pd.read_csv("X_test.csv")
-y_train = pd.read_csv("y_train.csv")
-y_test = pd.read_csv("y_test.csv")
+X_train_full = pd.read_parquet("X_train.parquet")
+X_test_full = pd.read_parquet("X_test.parquet")
+y_train = pd.read_parquet("y_train.parquet")
+y_test = pd.read_parquet("y_test.parquet")
 
 print(f"Original X_train shape: {X_train_full.shape}")
 print(f"Original X_test shape: {X_test_full.shape}")
@@ -131,6 +131,12 @@ print("="*80)
 all_models = {}
 all_predictions = {}
 
+# Fit and evaluate on raw ndarrays so the pickled estimators carry no
+# feature names — inference scores plain float32 arrays, and estimators
+# fitted on named frames warn about missing feature names on every call
+X_train_values = X_train.to_numpy()
+X_test_values = X_test.to_numpy()
+
 for target in targets:
     print(f"\n{'='*60}")
     print(f"Training models for: {target.upper()}")
@@ -157,10 +163,11 @@ for target in targets:
         reg_alpha=0.5,
         reg_lambda=1.5,
         random_state=42,
-        n_jobs=-1
+        n_jobs=-1,
+        tree_method='hist'  # histogram builder works on float32 natively
     )
-    xgb_model.fit(X_train, y_train_target, verbose=False)
-    xgb_pred = xgb_model.predict(X_test)
+    xgb_model.fit(X_train_values, y_train_target, verbose=False)
+    xgb_pred = xgb_model.predict(X_test_values)
     models['xgboost'] = xgb_model
     predictions['xgboost'] = xgb_pred
     
@@ -181,8 +188,8 @@ for target in targets:
         random_state=42,
         n_jobs=-1
     )
-    rf_model.fit(X_train, y_train_target)
-    rf_pred = rf_model.predict(X_test)
+    rf_model.fit(X_train_values, y_train_target)
+    rf_pred = rf_model.predict(X_test_values)
     models['random_forest'] = rf_model
     predictions['random_forest'] = rf_pred
     
@@ -202,8 +209,8 @@ for target in targets:
         l2_regularization=0.5,
         random_state=42
     )
-    gb_model.fit(X_train, y_train_target)
-    gb_pred = gb_model.predict(X_test)
+    gb_model.fit(X_train_values, y_train_target)
+    gb_pred = gb_model.predict(X_test_values)
     models['gradient_boosting'] = gb_model
     predictions['gradient_boosting'] = gb_pred
     
@@ -216,8 +223,8 @@ for target in targets:
     # ============================================
     print("  [4/4] Training Ridge Regression...")
     ridge_model = Ridge(alpha=10.0, random_state=42)
-    ridge_model.fit(X_train, y_train_target)
-    ridge_pred = ridge_model.predict(X_test)
+    ridge_model.fit(X_train_values, y_train_target)
+    ridge_pred = ridge_model.predict(X_test_values)
     models['ridge'] = ridge_model
     predictions['ridge'] = ridge_pred
     
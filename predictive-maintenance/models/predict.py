@@ -3,6 +3,8 @@ import joblib
 import pandas as pd
 import numpy as np
 
+from scorer import BatchScorer
+
 def predict_maintenance(input_data):
     """
     Predict maintenance indicators from sensor data.
@@ -30,36 +32,17 @@ def predict_maintenance(input_data):
     """
     # Load model
     model_package = joblib.load('predictive_maintenance_model.pkl')
-    
+    scorer = BatchScorer(model_package)
+
     # Create DataFrame from input
     df = pd.DataFrame([input_data])
-    
-    # Ensure correct feature order
-    df = df[model_package['feature_names']]
-    
-    # Make predictions for each target
-    predictions = {}
-    for target in model_package['target_names']:
-        target_models = model_package['all_models'][target]
-        weights = target_models['weights']
-        
-        # Get predictions from each model
-        xgb_pred = target_models['models']['xgboost'].predict(df)[0]
-        rf_pred = target_models['models']['random_forest'].predict(df)[0]
-        gb_pred = target_models['models']['gradient_boosting'].predict(df)[0]
-        ridge_pred = target_models['models']['ridge'].predict(df)[0]
-        
-        # Weighted ensemble
-        ensemble_pred = (
-            weights[0] * xgb_pred +
-            weights[1] * rf_pred +
-            weights[2] * gb_pred +
-            weights[3] * ridge_pred
-        )
-        
-        predictions[target] = round(float(ensemble_pred), 2)
-    
-    return predictions
+
+    # Ensure correct feature order, then score through the shared ensemble
+    df = df[scorer.feature_names]
+    scores = scorer.predict(df.to_numpy(dtype=np.float32), clip=False)[0]
+
+    return {target: round(float(score), 2)
+            for target, score in zip(scorer.targets, scores)}
 
 
 # Example usage
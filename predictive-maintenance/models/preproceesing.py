@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from sklearn.preprocessing import RobustScaler, LabelEncoder
 from sklearn.model_selection import train_test_split
 from scipy import stats
@@ -217,16 +218,26 @@ print("\n" + "="*80)
 print("SAVING PREPROCESSED FILES")
 print("="*80)
 
-X_train_scaled.to_csv('X_train.csv', index=False)
-X_test_scaled.to_csv('X_test.csv', index=False)
-y_train.to_csv('y_train.csv', index=False)
-y_test.to_csv('y_test.csv', index=False)
+# Same zstd Parquet artifacts model.py loads — written in parallel,
+# the four files are independent
+artifacts = [
+    (X_train_scaled, 'X_train.parquet'),
+    (X_test_scaled, 'X_test.parquet'),
+    (y_train, 'y_train.parquet'),
+    (y_test, 'y_test.parquet')
+]
+with ThreadPoolExecutor(max_workers=4) as executor:
+    list(executor.map(
+        lambda item: item[0].to_parquet(item[1], engine='pyarrow',
+                                        compression='zstd', index=False),
+        artifacts
+    ))
 
 print(f"\n✅ Files saved successfully:")
-print(f"   - X_train.csv: {X_train_scaled.shape}")
-print(f"   - X_test.csv:  {X_test_scaled.shape}")
-print(f"   - y_train.csv: {y_train.shape}")
-print(f"   - y_test.csv:  {y_test.shape}")
+print(f"   - X_train.parquet: {X_train_scaled.shape}")
+print(f"   - X_test.parquet:  {X_test_scaled.shape}")
+print(f"   - y_train.parquet: {y_train.shape}")
+print(f"   - y_test.parquet:  {y_test.shape}")
 
 print(f"\n📊 Summary:")
 print(f"   Total features: {X_train_scaled.shape[1]}")
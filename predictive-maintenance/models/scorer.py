@@ -0,0 +1,77 @@
+"""
+Shared batch scorer for the 4-model ensemble.
+Single implementation of "predict with each base model, weight, clip" so
+inference and the test scripts can't drift apart (or regress to per-row loops).
+"""
+
+import warnings
+
+import numpy as np
+
+# Base models always predict in this order; ensemble weights are stored
+# per target in the same order
+MODEL_ORDER = ("xgboost", "random_forest", "gradient_boosting", "ridge")
+
+
+class BatchScorer:
+    """Scores whole batches against every target's ensemble at once."""
+
+    def __init__(self, model_package):
+        self.targets = list(model_package["target_names"])
+        self.feature_names = list(model_package["feature_names"])
+
+        all_models = model_package["all_models"]
+        self.models_per_target = [
+            [all_models[target]["models"][name] for name in MODEL_ORDER]
+            for target in self.targets
+        ]
+
+        # (num_targets, num_models) ensemble weight matrix, stacked once
+        self.weight_matrix = np.stack([
+            np.asarray(all_models[target]["weights"], dtype=np.float32)
+            for target in self.targets
+        ])
+
+        # Raw Boosters for inplace_predict — skips the sklearn wrapper's
+        # validation and the DMatrix copy on every call
+        self.boosters = []
+        for target in self.targets:
+            xgb_model = all_models[target]["models"]["xgboost"]
+            get_booster = getattr(xgb_model, "get_booster", None)
+            self.boosters.append(get_booster() if get_booster else None)
+
+    def predict(self, X, clip=True):
+        """
+        Run the full ensemble over a batch.
+
+        Args:
+            X: (n_rows, n_features) array-like of (scaled) features
+            clip: clip ensemble outputs to the 0-100 score range
+
+        Returns:
+            (n_rows, num_targets) float32 ndarray, column order = self.targets
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+
+        out = np.empty((len(X), len(self.targets)), dtype=np.float32)
+        with warnings.catch_warnings():
+            # Model packages trained before model.py switched to ndarray
+            # fits carry feature names and warn on every ndarray predict;
+            # silence just that so the test scripts' output stays readable
+            warnings.filterwarnings(
+                'ignore', message='X does not have valid feature names',
+                category=UserWarning
+            )
+            for ti, models in enumerate(self.models_per_target):
+                # XGBoost predicts straight from the contiguous float32 batch;
+                # the sklearn estimators take the ndarray as-is
+                booster = self.boosters[ti]
+                xgb_pred = booster.inplace_predict(X) if booster is not None else models[0].predict(X)
+
+                # (n_rows, 4) base predictions -> one matvec per target
+                preds = np.column_stack([xgb_pred] + [model.predict(X) for model in models[1:]])
+                out[:, ti] = preds @ self.weight_matrix[ti]
+
+        if clip:
+            np.clip(out, 0, 100, out=out)
+        return out
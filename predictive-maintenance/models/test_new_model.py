@@ -2,6 +2,8 @@ import joblib
 import pandas as pd
 import numpy as np
 
+from scorer import BatchScorer
+
 print("="*80)
 print("TESTING NEW MODEL - REALISTIC SCENARIOS")
 print("="*80)
@@ -48,52 +50,28 @@ print("\n" + "="*80)
 print("TEST PREDICTIONS (0-100 SCALE)")
 print("="*80)
 
-for scenario_name, data in [("PERFECT MACHINE", perfect), 
-                             ("TERRIBLE MACHINE", terrible),
-                             ("HEALTHY PUMP (PMP-001)", healthy_pump)]:
+scenario_names = ["PERFECT MACHINE", "TERRIBLE MACHINE", "HEALTHY PUMP (PMP-001)"]
+
+# Stack all scenarios into one (3, 8) matrix — the shared scorer calls
+# each model once per target instead of once per scenario per target
+X = pd.concat([perfect, terrible, healthy_pump], ignore_index=True)
+
+scorer = BatchScorer(model_package)
+scores = scorer.predict(X.to_numpy(dtype=np.float32))
+target_index = {target: ti for ti, target in enumerate(scorer.targets)}
+
+for i, scenario_name in enumerate(scenario_names):
     print(f"\n{scenario_name}:")
     print("-" * 60)
-    
-    for target in model_package['target_names']:
-        target_block = model_package['all_models'][target]
-        models = target_block['models']
-        weights = target_block['weights']
-        
-        preds = np.array([
-            models["xgboost"].predict(data)[0],
-            models["random_forest"].predict(data)[0],
-            models["gradient_boosting"].predict(data)[0],
-            models["ridge"].predict(data)[0]
-        ])
-        
-        ensemble_pred = np.dot(weights, preds)
-        clipped = np.clip(ensemble_pred, 0, 100)
-        
-        print(f"  {target:20s}: {clipped:6.1f}")
-    
-    # Calculate overall health
-    vib = np.clip(np.dot(weights, [
-        models["xgboost"].predict(data)[0] for models in 
-        [model_package['all_models']['vibration_health']['models']]
-    ][0].values()), 0, 100)
-    
-    therm = np.clip(np.dot(
-        model_package['all_models']['thermal_health']['weights'],
-        [m.predict(data)[0] for m in model_package['all_models']['thermal_health']['models'].values()]
-    ), 0, 100)
-    
-    eff = np.clip(np.dot(
-        model_package['all_models']['efficiency_index']['weights'],
-        [m.predict(data)[0] for m in model_package['all_models']['efficiency_index']['models'].values()]
-    ), 0, 100)
-    
-    risk = np.clip(np.dot(
-        model_package['all_models']['failure_risk']['weights'],
-        [m.predict(data)[0] for m in model_package['all_models']['failure_risk']['models'].values()]
-    ), 0, 100)
-    
-    health = (vib + therm + eff) / 3
-    
+
+    for ti, target in enumerate(scorer.targets):
+        print(f"  {target:20s}: {scores[i, ti]:6.1f}")
+
+    # Calculate overall health from the already-computed ensembles
+    health = (scores[i, target_index['vibration_health']] +
+              scores[i, target_index['thermal_health']] +
+              scores[i, target_index['efficiency_index']]) / 3
+
     print(f"\n  Overall Health Score: {health:.1f}/100")
     if health >= 70:
         print(f"  Risk Assessment: ✅ LOW RISK")
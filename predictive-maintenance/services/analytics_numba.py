@@ -0,0 +1,69 @@
+"""
+Numba-compiled analytics kernel for very large fleets.
+Fuses health score, risk level and dominant issue into a single parallel
+pass over the index arrays — each row is visited once instead of once per
+derived column, which matters because this computation is memory-bound.
+
+Imported lazily by services.analytics; callers never use this directly.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+# Code tables decoded by the caller via pd.Categorical.from_codes
+RISK_CATEGORIES = ('Critical', 'High', 'Medium', 'Low')
+ISSUE_CATEGORIES = ('Operational', 'Combined', 'Vibration', 'Thermal', 'Efficiency')
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def compute_analytics(efficiency, vibration, thermal):
+    """
+    Fused per-row analytics over float32 index arrays.
+
+    Returns:
+        (health_score float32, risk_codes int8, issue_codes int8) —
+        codes index into RISK_CATEGORIES / ISSUE_CATEGORIES
+    """
+    n = efficiency.shape[0]
+    health_score = np.empty(n, dtype=np.float32)
+    risk_codes = np.empty(n, dtype=np.int8)
+    issue_codes = np.empty(n, dtype=np.int8)
+
+    for i in prange(n):
+        eff = efficiency[i]
+        vib = vibration[i]
+        thm = thermal[i]
+
+        hs = 0.50 * eff + 0.30 * (100.0 - vib) + 0.20 * (100.0 - thm)
+        if hs < 0.0:
+            hs = 0.0
+        elif hs > 100.0:
+            hs = 100.0
+        health_score[i] = hs
+
+        if hs >= 80.0:
+            risk_codes[i] = 3  # Low
+        elif hs >= 60.0:
+            risk_codes[i] = 2  # Medium
+        elif hs >= 40.0:
+            risk_codes[i] = 1  # High
+        else:
+            risk_codes[i] = 0  # Critical
+
+        vibration_issue = vib > 60.0
+        thermal_issue = thm > 60.0
+        efficiency_issue = eff < 70.0
+        issue_count = int(vibration_issue) + int(thermal_issue) + int(efficiency_issue)
+
+        if issue_count == 0:
+            issue_codes[i] = 0  # Operational
+        elif issue_count >= 2:
+            issue_codes[i] = 1  # Combined
+        elif vibration_issue:
+            issue_codes[i] = 2  # Vibration
+        elif thermal_issue:
+            issue_codes[i] = 3  # Thermal
+        else:
+            issue_codes[i] = 4  # Efficiency
+
+    return health_score, risk_codes, issue_codes
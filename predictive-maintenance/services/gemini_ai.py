@@ -3,8 +3,14 @@ Google Gemini AI Service for Industrial Maintenance Intelligence
 Provides real AI-powered diagnostics, root cause analysis, and maintenance recommendations
 """
 
+import hashlib
+import json
 import os
-from typing import Dict, Any, Optional
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
 
 try:
@@ -14,6 +20,148 @@ except ImportError:
     GEMINI_AVAILABLE = False
 
 
+# Prompt pieces built once at import — _build_analysis_prompt is on the
+# hot path of every analysis request and only needs to fill in values
+_DEPTH_INSTRUCTIONS = {
+    "Quick Scan": "Provide a concise analysis focusing on the most critical issues.",
+    "Standard": "Provide a balanced analysis with root cause, recommendations, and timeline.",
+    "Deep Analysis": "Provide comprehensive analysis including detailed root cause analysis, failure progression, environmental factors, and long-term strategy."
+}
+
+_PROMPT_TEMPLATE = """You are an expert industrial maintenance engineer analyzing equipment sensor data and ML predictions.
+
+**Analysis Depth:** {analysis_depth}
+{depth_instruction}
+
+**Machine Sensor Data:**
+{sensor_block}
+
+**ML Prediction Outputs:**
+- Vibration Index: {vibration_index:.1f} (Lower is better, >60 is concerning)
+- Thermal Index: {thermal_index:.1f} (Lower is better, >60 is concerning)
+- Efficiency Index: {efficiency_index:.1f}% (Higher is better, <70% needs attention)
+
+**Your Task:**
+Provide a structured analysis with the following sections:
+
+1. **ROOT CAUSE DIAGNOSIS** (2-3 sentences)
+   - What is the primary failure mode?
+   - What sensor readings support this diagnosis?
+
+2. **RISK ASSESSMENT** (2-3 sentences)
+   - What is the current failure risk level? (Low/Medium/High/Critical)
+   - What is the estimated time until failure?
+   - What are the consequences of inaction?
+
+3. **MAINTENANCE RECOMMENDATIONS** (4-6 bullet points)
+   - Immediate actions (0-6 hours)
+   - Short-term maintenance (1-2 days)
+   - Long-term preventive measures
+   - Specific parts/procedures to address
+
+4. **MAINTENANCE TIMELINE**
+   - Immediate (0-6 hours): [action]
+   - Short-term (1-2 days): [action]
+   - Medium-term (1-2 weeks): [action]
+   - Long-term (ongoing): [action]
+
+5. **COST IMPACT ANALYSIS** (2-3 sentences)
+   - Estimated monthly loss due to degradation
+   - Potential catastrophic failure cost
+   - ROI of preventive maintenance
+
+Respond in a professional, data-driven tone suitable for plant managers and maintenance engineers.
+"""
+
+# Section headers recognised in AI responses, mapped to result keys.
+# Compiled once; longest phrases first so e.g. "MAINTENANCE RECOMMENDATION"
+# wins over the bare "RECOMMENDATIONS" alternative
+_SECTION_KEYS = {
+    'ROOT CAUSE': 'root_cause',
+    'DIAGNOSIS': 'root_cause',
+    'RISK ASSESSMENT': 'risk_assessment',
+    'RISK LEVEL': 'risk_assessment',
+    'MAINTENANCE RECOMMENDATION': 'maintenance_recommendations',
+    'RECOMMENDATIONS': 'maintenance_recommendations',
+    'MAINTENANCE TIMELINE': 'timeline',
+    'TIMELINE': 'timeline',
+    'COST IMPACT': 'cost_impact',
+    'FINANCIAL IMPACT': 'cost_impact'
+}
+_SECTION_RE = re.compile(
+    r'^[\s0-9.*#]*(' + '|'.join(sorted(_SECTION_KEYS, key=len, reverse=True)) + r')',
+    re.IGNORECASE
+)
+
+_SENSOR_FIELDS = {
+    'air_temperature_k': 'Air Temperature',
+    'process_temperature_k': 'Process Temperature',
+    'rotational_speed_rpm': 'Rotational Speed',
+    'torque_nm': 'Torque',
+    'tool_wear_min': 'Tool Wear',
+    'temperature': 'Ambient Temperature',
+    'humidity': 'Humidity',
+    'rainfall': 'Rainfall'
+}
+
+
+# Response cache — machines in the same sensor/prediction bucket produce
+# effectively identical prompts, so duplicate Gemini calls are wasted
+# latency and API cost. Inputs are quantized to one decimal before
+# hashing so near-identical readings collide on purpose. In-memory LRU
+# for the hot path plus JSON files for persistence across restarts.
+_CACHE_MAXSIZE = 10_000
+_CACHE_DIR = Path(os.getenv("GEMINI_CACHE_DIR", ".gemini_cache"))
+_response_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def _quantize_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Round numeric values to 1 decimal so nearby readings share a key"""
+    quantized = {}
+    for key, value in data.items():
+        try:
+            quantized[key] = round(float(value), 1)
+        except (TypeError, ValueError):
+            quantized[key] = str(value)
+    return quantized
+
+
+def _cache_key(machine_data, prediction_data, analysis_depth) -> str:
+    payload = json.dumps(
+        [_quantize_dict(machine_data), _quantize_dict(prediction_data), analysis_depth],
+        sort_keys=True
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _cache_lookup(key: str) -> Optional[Dict[str, Any]]:
+    if key in _response_cache:
+        _response_cache.move_to_end(key)
+        return _response_cache[key]
+    try:
+        cached = json.loads((_CACHE_DIR / f"{key}.json").read_text())
+    except (OSError, ValueError):
+        return None
+    _response_cache[key] = cached
+    return cached
+
+
+def _cache_store(key: str, analysis: Dict[str, Any]) -> None:
+    # prediction_data is never cached: its numpy scalars don't survive the
+    # JSON round-trip (they come back as strings and break the UI's numeric
+    # formatting), and a quantized key can collide across machines — so
+    # every hit re-attaches the caller's own fresh dict instead
+    stored = {k: v for k, v in analysis.items() if k != 'prediction_data'}
+    _response_cache[key] = stored
+    while len(_response_cache) > _CACHE_MAXSIZE:
+        _response_cache.popitem(last=False)
+    try:
+        _CACHE_DIR.mkdir(exist_ok=True)
+        (_CACHE_DIR / f"{key}.json").write_text(json.dumps(stored, default=str))
+    except OSError:
+        pass  # persistence is best-effort; the in-memory entry still serves
+
+
 class GeminiAIService:
     """Service class for Google Gemini AI integration"""
     
@@ -67,103 +215,92 @@ class GeminiAIService:
                 "error_message": "Gemini AI not configured. Please set GOOGLE_AI_API_KEY environment variable."
             }
         
+        # Serve repeated/near-identical inputs from the cache instead of
+        # paying another API round-trip
+        cache_key = _cache_key(machine_data, prediction_data, analysis_depth)
+        cached = _cache_lookup(cache_key)
+        if cached is not None:
+            result = dict(cached)
+            result['prediction_data'] = prediction_data
+            return result
+
         try:
             # Build context-rich prompt
             prompt = self._build_analysis_prompt(machine_data, prediction_data, analysis_depth)
-            
+
             # Generate AI response
             response = self.model.generate_content(prompt)
-            
+
             # Parse structured response
             analysis = self._parse_ai_response(response.text, prediction_data)
             analysis["status"] = "success"
-            
+
+            _cache_store(cache_key, analysis)
             return analysis
-            
+
         except Exception as e:
             return {
                 "status": "error",
                 "error_message": f"AI analysis failed: {str(e)}"
             }
     
-    def _build_analysis_prompt(
+    def generate_maintenance_analysis_batch(
         self,
-        machine_data: Dict[str, Any],
-        prediction_data: Dict[str, Any],
-        analysis_depth: str
-    ) -> str:
-        """Build comprehensive prompt for AI analysis"""
-        
-        # Determine analysis scope
-        depth_instructions = {
-            "Quick Scan": "Provide a concise analysis focusing on the most critical issues.",
-            "Standard": "Provide a balanced analysis with root cause, recommendations, and timeline.",
-            "Deep Analysis": "Provide comprehensive analysis including detailed root cause analysis, failure progression, environmental factors, and long-term strategy."
-        }
-        
-        prompt = f"""You are an expert industrial maintenance engineer analyzing equipment sensor data and ML predictions.
-
-**Analysis Depth:** {analysis_depth}
-{depth_instructions.get(analysis_depth, depth_instructions["Standard"])}
-
-**Machine Sensor Data:**
-{self._format_sensor_data(machine_data)}
-
-**ML Prediction Outputs:**
-- Vibration Index: {prediction_data.get('vibration_index', 'N/A'):.1f} (Lower is better, >60 is concerning)
-- Thermal Index: {prediction_data.get('thermal_index', 'N/A'):.1f} (Lower is better, >60 is concerning)
-- Efficiency Index: {prediction_data.get('efficiency_index', 'N/A'):.1f}% (Higher is better, <70% needs attention)
+        items: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        analysis_depth: str = "Standard",
+        max_workers: int = 16
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate analyses for a batch of machines concurrently
 
-**Your Task:**
-Provide a structured analysis with the following sections:
+        Each Gemini call is network-bound, so fanning the requests out
+        over a thread pool collapses N sequential round-trips into
+        roughly one. Results keep the order of the input items.
 
-1. **ROOT CAUSE DIAGNOSIS** (2-3 sentences)
-   - What is the primary failure mode?
-   - What sensor readings support this diagnosis?
+        Args:
+            items: List of (machine_data, prediction_data) tuples
+            analysis_depth: One of ["Quick Scan", "Standard", "Deep Analysis"]
+            max_workers: Maximum concurrent API requests
 
-2. **RISK ASSESSMENT** (2-3 sentences)
-   - What is the current failure risk level? (Low/Medium/High/Critical)
-   - What is the estimated time until failure?
-   - What are the consequences of inaction?
+        Returns:
+            List of analysis result dictionaries, one per input item
+        """
+        if not items:
+            return []
 
-3. **MAINTENANCE RECOMMENDATIONS** (4-6 bullet points)
-   - Immediate actions (0-6 hours)
-   - Short-term maintenance (1-2 days)
-   - Long-term preventive measures
-   - Specific parts/procedures to address
+        if not self.is_configured:
+            return [{
+                "status": "error",
+                "error_message": "Gemini AI not configured. Please set GOOGLE_AI_API_KEY environment variable."
+            } for _ in items]
 
-4. **MAINTENANCE TIMELINE**
-   - Immediate (0-6 hours): [action]
-   - Short-term (1-2 days): [action]
-   - Medium-term (1-2 weeks): [action]
-   - Long-term (ongoing): [action]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(
+                lambda item: self.generate_maintenance_analysis(item[0], item[1], analysis_depth),
+                items
+            ))
 
-5. **COST IMPACT ANALYSIS** (2-3 sentences)
-   - Estimated monthly loss due to degradation
-   - Potential catastrophic failure cost
-   - ROI of preventive maintenance
+    def _build_analysis_prompt(
+        self,
+        machine_data: Dict[str, Any],
+        prediction_data: Dict[str, Any],
+        analysis_depth: str
+    ) -> str:
+        """Build comprehensive prompt for AI analysis"""
+        return _PROMPT_TEMPLATE.format(
+            analysis_depth=analysis_depth,
+            depth_instruction=_DEPTH_INSTRUCTIONS.get(analysis_depth, _DEPTH_INSTRUCTIONS["Standard"]),
+            sensor_block=self._format_sensor_data(machine_data),
+            vibration_index=prediction_data.get('vibration_index', 'N/A'),
+            thermal_index=prediction_data.get('thermal_index', 'N/A'),
+            efficiency_index=prediction_data.get('efficiency_index', 'N/A')
+        )
 
-Respond in a professional, data-driven tone suitable for plant managers and maintenance engineers.
-"""
-        return prompt
-    
     def _format_sensor_data(self, machine_data: Dict[str, Any]) -> str:
         """Format sensor data for prompt"""
         lines = []
-        
-        # Common sensor fields
-        sensor_fields = {
-            'air_temperature_k': 'Air Temperature',
-            'process_temperature_k': 'Process Temperature',
-            'rotational_speed_rpm': 'Rotational Speed',
-            'torque_nm': 'Torque',
-            'tool_wear_min': 'Tool Wear',
-            'temperature': 'Ambient Temperature',
-            'humidity': 'Humidity',
-            'rainfall': 'Rainfall'
-        }
-        
-        for field, label in sensor_fields.items():
+
+        for field, label in _SENSOR_FIELDS.items():
             if field in machine_data:
                 value = machine_data[field]
                 if field.endswith('_k'):
@@ -186,45 +323,122 @@ Respond in a professional, data-driven tone suitable for plant managers and main
         This is a simple parser that extracts sections from the response.
         In production, you might use more sophisticated NLP parsing.
         """
-        # Extract sections using simple text parsing
-        sections = {
-            "root_cause": "",
-            "risk_assessment": "",
-            "maintenance_recommendations": "",
-            "timeline": "",
-            "cost_impact": "",
-            "full_response": response_text
+        # Accumulate each section as a list of lines and join once at the
+        # end — repeated str += would reallocate the growing section body
+        # on every line
+        section_lines = {
+            "root_cause": [],
+            "risk_assessment": [],
+            "maintenance_recommendations": [],
+            "timeline": [],
+            "cost_impact": []
         }
-        
-        # Try to extract sections (simplified parsing)
-        lines = response_text.split('\n')
-        current_section = None
-        
-        for line in lines:
-            line_upper = line.upper()
-            if 'ROOT CAUSE' in line_upper or 'DIAGNOSIS' in line_upper:
-                current_section = 'root_cause'
-            elif 'RISK ASSESSMENT' in line_upper or 'RISK LEVEL' in line_upper:
-                current_section = 'risk_assessment'
-            elif 'MAINTENANCE RECOMMENDATION' in line_upper or 'RECOMMENDATIONS' in line_upper:
-                current_section = 'maintenance_recommendations'
-            elif 'TIMELINE' in line_upper or 'MAINTENANCE TIMELINE' in line_upper:
-                current_section = 'timeline'
-            elif 'COST IMPACT' in line_upper or 'FINANCIAL IMPACT' in line_upper:
-                current_section = 'cost_impact'
-            elif current_section and line.strip():
-                sections[current_section] += line + "\n"
-        
-        # Clean up sections
-        for key in sections:
-            if key != 'full_response':
-                sections[key] = sections[key].strip()
-        
+
+        # Single pass: one precompiled regex match per line instead of
+        # uppercasing every line and running ten substring checks
+        self._feed_lines(response_text.split('\n'), section_lines, None)
+
+        sections = {key: '\n'.join(lines) for key, lines in section_lines.items()}
+        sections['full_response'] = response_text
+
         # Add prediction data for reference
         sections['prediction_data'] = prediction_data
-        
+
         return sections
 
+    @staticmethod
+    def _feed_lines(lines, section_lines, current_section):
+        """Route completed lines into their sections; returns the section
+        the parser is in afterwards so streaming callers can resume"""
+        for line in lines:
+            header = _SECTION_RE.match(line)
+            if header:
+                current_section = _SECTION_KEYS[header.group(1).upper()]
+            elif current_section and line.strip():
+                section_lines[current_section].append(line)
+        return current_section
+
+    def generate_maintenance_analysis_stream(
+        self,
+        machine_data: Dict[str, Any],
+        prediction_data: Dict[str, Any],
+        analysis_depth: str = "Standard"
+    ):
+        """
+        Stream the maintenance analysis, parsing sections as chunks arrive
+
+        Yields result dictionaries shaped like generate_maintenance_analysis
+        output: intermediate ones with status "streaming" (sections filled
+        in as far as the model has produced them, so the UI can re-render
+        per chunk instead of waiting for the full response) and a final
+        one with status "success" or "error". Cache hits yield the cached
+        result immediately.
+        """
+        if not self.is_configured:
+            yield {
+                "status": "error",
+                "error_message": "Gemini AI not configured. Please set GOOGLE_AI_API_KEY environment variable."
+            }
+            return
+
+        cache_key = _cache_key(machine_data, prediction_data, analysis_depth)
+        cached = _cache_lookup(cache_key)
+        if cached is not None:
+            result = dict(cached)
+            result['prediction_data'] = prediction_data
+            yield result
+            return
+
+        try:
+            prompt = self._build_analysis_prompt(machine_data, prediction_data, analysis_depth)
+            response = self.model.generate_content(prompt, stream=True)
+
+            # Incremental parse state: completed lines go straight through
+            # the section router; the trailing partial line waits for the
+            # next chunk
+            section_lines = {
+                "root_cause": [],
+                "risk_assessment": [],
+                "maintenance_recommendations": [],
+                "timeline": [],
+                "cost_impact": []
+            }
+            current_section = None
+            chunks = []
+            pending = ""
+
+            for chunk in response:
+                text = getattr(chunk, "text", "") or ""
+                if not text:
+                    continue
+                chunks.append(text)
+
+                lines = (pending + text).split('\n')
+                pending = lines.pop()
+                current_section = self._feed_lines(lines, section_lines, current_section)
+
+                partial = {key: '\n'.join(lines) for key, lines in section_lines.items()}
+                partial['full_response'] = ''.join(chunks)
+                partial['prediction_data'] = prediction_data
+                partial['status'] = "streaming"
+                yield partial
+
+            # Flush the last partial line and emit the final result
+            self._feed_lines([pending], section_lines, current_section)
+            analysis = {key: '\n'.join(lines) for key, lines in section_lines.items()}
+            analysis['full_response'] = ''.join(chunks)
+            analysis['prediction_data'] = prediction_data
+            analysis['status'] = "success"
+
+            _cache_store(cache_key, analysis)
+            yield analysis
+
+        except Exception as e:
+            yield {
+                "status": "error",
+                "error_message": f"AI analysis failed: {str(e)}"
+            }
+
 
 def get_ai_service(api_key: Optional[str] = None) -> GeminiAIService:
     """